@@ -96,6 +96,7 @@ class ClipsView(fov.DatasetView):
         self.__stages = _stages
         self.__media_type = _media_type
         self.__name = _name
+        self.__source_stages = None
 
     def __copy__(self):
         return self.__class__(
@@ -145,11 +146,14 @@ class ClipsView(fov.DatasetView):
 
     @property
     def _all_stages(self):
-        return (
-            self._source_collection.view()._all_stages
-            + [self._clips_stage]
-            + self.__stages
-        )
+        # The source stages never change, so they are computed only once
+        if self.__source_stages is None:
+            self.__source_stages = (
+                self._source_collection.view()._all_stages
+                + [self._clips_stage]
+            )
+
+        return self.__source_stages + self.__stages
 
     @property
     def name(self):
@@ -480,6 +484,7 @@ class TrajectoriesView(ClipsView):
         self.__stages = _stages
         self.__media_type = _media_type
         self.__name = _name
+        self.__source_stages = None
 
     def __copy__(self):
         return self.__class__(
@@ -497,9 +502,15 @@ class TrajectoriesView(ClipsView):
 
     @property
     def _all_stages(self):
+        # The source stages never change, so they are computed only once
+        if self.__source_stages is None:
+            self.__source_stages = (
+                self._source_collection.view()._all_stages
+                + [self._clips_stage]
+            )
+
         return (
-            self._source_collection.view()._all_stages
-            + [self._clips_stage]
+            self.__source_stages
             + self.__stages[self._num_trajectory_stages :]
         )
 
@@ -159,9 +159,18 @@ class SaveContext(object):
             self._frame_ops.clear()
 
         if self._reload_parents:
+            views = {}
             for sample in self._reload_parents:
                 sample._reload_parents()
 
+                view = sample._view
+                views.setdefault(id(view), (view, []))[1].append(sample)
+
+            # Generated views may need to sync the saved samples to their
+            # source collections
+            for view, samples in views.values():
+                view._sync_source_samples(samples)
+
             self._reload_parents.clear()
 
 
@@ -1538,6 +1547,9 @@ class SampleCollection(object):
         view = self.match_tags(tags)
         view._edit_sample_tags(update)
 
+    def _sync_source_samples(self, samples):
+        pass
+
     def _edit_sample_tags(self, update):
         ids = []
         ops = []
@@ -2714,6 +2726,16 @@ class SampleCollection(object):
             )
 
     def _set_labels(self, field_name, sample_ids, label_docs, progress=False):
+        ops, ids, is_frame_field = self._make_set_labels_ops(
+            field_name, sample_ids, label_docs
+        )
+
+        if ops:
+            self._dataset._bulk_write(
+                ops, ids=ids, frames=is_frame_field, progress=progress
+            )
+
+    def _make_set_labels_ops(self, field_name, sample_ids, label_docs):
         if self._is_group_field(field_name):
             raise ValueError(
                 "This method does not support setting attached group fields "
@@ -2762,13 +2784,12 @@ class SampleCollection(object):
                     )
                 )
 
-        if ops:
-            self._dataset._bulk_write(
-                ops, ids=ids, frames=is_frame_field, progress=progress
-            )
+        return ops, ids, is_frame_field
 
-    def _delete_labels(self, ids, fields=None):
-        self._dataset.delete_labels(ids=ids, fields=fields)
+    def _delete_labels(self, ids, fields=None, sample_ids=None):
+        self._dataset.delete_labels(
+            ids=ids, fields=fields, sample_ids=sample_ids
+        )
 
     def compute_metadata(
         self,
@@ -3084,7 +3084,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._clear_groups(group_ids=group_ids)
 
     def delete_labels(
-        self, labels=None, ids=None, tags=None, view=None, fields=None
+        self,
+        labels=None,
+        ids=None,
+        tags=None,
+        view=None,
+        fields=None,
+        sample_ids=None,
     ):
         """Deletes the specified labels from the dataset.
 
@@ -3117,6 +3123,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 dataset containing the labels to delete
             fields (None): a field or iterable of fields from which to delete
                 labels
+            sample_ids (None): an optional sample ID or iterable of sample IDs
+                that contain the labels to delete. If provided, only these
+                samples are searched for labels to delete, which is more
+                efficient when the labels are known to come from a small subset
+                of the dataset. Only applies to the ``ids``, ``tags``, and
+                ``view`` arguments, since ``labels`` already specify the
+                samples that contain them
         """
         if labels is not None:
             self._delete_labels(labels, fields=fields)
@@ -3136,6 +3149,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if etau.is_str(tags):
             tags = [tags]
 
+        if etau.is_str(sample_ids):
+            sample_ids = [sample_ids]
+
+        if sample_ids is not None:
+            sample_ids = [ObjectId(_id) for _id in sample_ids]
+
         if fields is None:
             fields = self._get_label_fields()
         elif etau.is_str(fields):
@@ -3153,9 +3172,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             root, is_list_field = self._get_label_field_root(field)
             root, is_frame_field = self._handle_frame_field(root)
 
+            if sample_ids is not None:
+                sample_path = "_sample_id" if is_frame_field else "_id"
+                sample_query = {sample_path: {"$in": sample_ids}}
+            else:
+                sample_query = {}
+
             ops = []
             if is_list_field:
-                query = {root: {"$exists": True}}
+                query = {root: {"$exists": True}, **sample_query}
 
                 if view_ids is not None:
                     ops.append(
@@ -3190,7 +3215,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 if view_ids is not None:
                     ops.append(
                         UpdateMany(
-                            {root + "._id": {"$in": view_ids}},
+                            {root + "._id": {"$in": view_ids}, **sample_query},
                             {"$set": {root: None}},
                         )
                     )
@@ -3198,7 +3223,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 if ids is not None:
                     ops.append(
                         UpdateMany(
-                            {root + "._id": {"$in": ids}},
+                            {root + "._id": {"$in": ids}, **sample_query},
                             {"$set": {root: None}},
                         )
                     )
@@ -3206,7 +3231,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 if tags is not None:
                     ops.append(
                         UpdateMany(
-                            {root + ".tags": {"$elemMatch": {"$in": tags}}},
+                            {
+                                root + ".tags": {"$elemMatch": {"$in": tags}},
+                                **sample_query,
+                            },
                             {"$set": {root: None}},
                         )
                     )
@@ -10,15 +10,13 @@ from copy import deepcopy
 
 from bson import ObjectId
 
-import eta.core.utils as etau
-
-import fiftyone.core.aggregations as foa
 import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fova
 import fiftyone.core.view as fov
 
@@ -37,10 +35,10 @@ class _PatchView(fos.SampleView):
         return ObjectId(self._doc.frame_id)
 
     def _save(self, deferred=False):
+        # Deferred saves are synced to the source collection in batches by
+        # the save context via `_sync_source_samples()`
         if deferred:
-            raise NotImplementedError(
-                "Patches views do not support save contexts"
-            )
+            return super()._save(deferred=deferred)
 
         super()._save(deferred=deferred)
         self._view._sync_source_sample(self)
@@ -106,6 +104,11 @@ class _PatchesView(fov.DatasetView):
         self.__media_type = _media_type
         self.__name = _name
 
+        self.__label_fields_set = None
+        self.__source_stages = None
+        self.__label_types = {}
+        self.__source_label_paths = {}
+
     def __copy__(self):
         return self.__class__(
             self._source_collection,
@@ -138,11 +141,14 @@ class _PatchesView(fov.DatasetView):
 
     @property
     def _all_stages(self):
-        return (
-            self._source_collection.view()._all_stages
-            + [self._patches_stage]
-            + self.__stages
-        )
+        # The source stages never change, so they are computed only once
+        if self.__source_stages is None:
+            self.__source_stages = (
+                self._source_collection.view()._all_stages
+                + [self._patches_stage]
+            )
+
+        return self.__source_stages + self.__stages
 
     @property
     def _id_field(self):
@@ -155,6 +161,13 @@ class _PatchesView(fov.DatasetView):
     def _label_fields(self):
         raise NotImplementedError("subclass must implement _label_fields")
 
+    @property
+    def _label_fields_set(self):
+        if self.__label_fields_set is None:
+            self.__label_fields_set = frozenset(self._label_fields)
+
+        return self.__label_fields_set
+
     @property
     def name(self):
         return self.__name
@@ -177,32 +190,59 @@ class _PatchesView(fov.DatasetView):
         self.__media_type = media_type
 
     def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
-        if label_field in self._label_fields:
-            _ids = self.values("_" + self._id_field)
+        if label_field not in self._label_fields_set:
+            super()._tag_labels(
+                tags, label_field, ids=ids, label_ids=label_ids
+            )
+            return
+
+        ids, _ids, label_ids = self._get_label_tag_ids(
+            label_field, ids, label_ids
+        )
 
         _, label_ids = super()._tag_labels(
             tags, label_field, ids=ids, label_ids=label_ids
         )
 
-        if label_field in self._label_fields:
-            ids, label_ids = self._to_source_ids(label_field, _ids, label_ids)
-            self._source_collection._tag_labels(
+        ids, label_ids = self._to_source_ids(label_field, _ids, label_ids)
+        self._source_collection._tag_labels(
+            tags, label_field, ids=ids, label_ids=label_ids
+        )
+
+    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
+        if label_field not in self._label_fields_set:
+            super()._untag_labels(
                 tags, label_field, ids=ids, label_ids=label_ids
             )
+            return
 
-    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
-        if label_field in self._label_fields:
-            _ids = self.values("_" + self._id_field)
+        ids, _ids, label_ids = self._get_label_tag_ids(
+            label_field, ids, label_ids
+        )
 
         _, label_ids = super()._untag_labels(
             tags, label_field, ids=ids, label_ids=label_ids
         )
 
-        if label_field in self._label_fields:
-            ids, label_ids = self._to_source_ids(label_field, _ids, label_ids)
-            self._source_collection._untag_labels(
-                tags, label_field, ids=ids, label_ids=label_ids
+        ids, label_ids = self._to_source_ids(label_field, _ids, label_ids)
+        self._source_collection._untag_labels(
+            tags, label_field, ids=ids, label_ids=label_ids
+        )
+
+    def _get_label_tag_ids(self, label_field, ids, label_ids):
+        # Retrieve the patch IDs and label IDs that the base implementation
+        # would otherwise query separately in the same pass as the source IDs
+        src_id_path = "_" + self._id_field
+
+        if ids is None or label_ids is None:
+            label_id_path = self._get_patches_label_path(label_field, "_id")
+            ids, src_ids, label_ids = self.values(
+                ["_id", src_id_path, label_id_path]
             )
+        else:
+            src_ids = self.values(src_id_path)
+
+        return ids, src_ids, label_ids
 
     def _to_source_ids(self, label_field, ids, label_ids):
         _, is_list_field = self._source_collection._get_label_field_root(
@@ -212,21 +252,29 @@ class _PatchesView(fov.DatasetView):
         if not is_list_field:
             return ids, label_ids
 
+        # Flatten to (sample ID, label ID) pairs once up front rather than
+        # checking whether each patch contains a label list
+        label_type = self._get_patches_label_type(label_field)
+        if issubclass(label_type, fol._HasLabelList):
+            pairs = (
+                (_id, _label_id)
+                for _id, _label_ids in zip(ids, label_ids)
+                if _label_ids
+                for _label_id in _label_ids
+            )
+        else:
+            pairs = zip(ids, label_ids)
+
         id_map = defaultdict(list)
-        for _id, _label_id in zip(ids, label_ids):
-            if etau.is_container(_label_id):
-                id_map[_id].extend(_label_id)
-            else:
+        for _id, _label_id in pairs:
+            if _label_id is not None:
                 id_map[_id].append(_label_id)
 
-        if not id_map:
-            return [], []
-
-        return zip(*id_map.items())
+        return list(id_map.keys()), list(id_map.values())
 
     def set_values(self, field_name, *args, **kwargs):
         field = field_name.split(".", 1)[0]
-        must_sync = field in self._label_fields
+        must_sync = field in self._label_fields_set
 
         # The `set_values()` operation could change the contents of this view,
         # so we first record the sample IDs that need to be synced
@@ -237,18 +285,19 @@ class _PatchesView(fov.DatasetView):
 
         super().set_values(field_name, *args, **kwargs)
 
-        self._sync_source_field(field, ids=ids)
-        self._sync_source_field_schema(field_name)
+        if must_sync:
+            self._sync_source_field(field, ids=ids)
+            self._sync_source_field_schema(field_name)
 
     def set_label_values(self, field_name, *args, **kwargs):
         field = field_name.split(".", 1)[0]
-        must_sync = field in self._label_fields
+        must_sync = field in self._label_fields_set
 
         super().set_label_values(field_name, *args, **kwargs)
 
         if must_sync:
-            _, root = self._get_label_field_path(field)
-            _, src_root = self._source_collection._get_label_field_path(field)
+            root = self._get_patches_label_path(field)
+            src_root = self._get_source_label_path(field)
             _field_name = src_root + field_name[len(root) :]
 
             self._source_collection.set_label_values(
@@ -274,7 +323,7 @@ class _PatchesView(fov.DatasetView):
             fields (None): an optional field or list of fields to save. If
                 specified, only these fields are overwritten
         """
-        if etau.is_str(fields):
+        if isinstance(fields, str):
             fields = [fields]
 
         super().save(fields=fields)
@@ -282,9 +331,10 @@ class _PatchesView(fov.DatasetView):
         if fields is None:
             fields = self._label_fields
         else:
-            fields = [l for l in fields if l in self._label_fields]
+            fields = [l for l in fields if l in self._label_fields_set]
 
-        self._sync_source_root(fields)
+        if fields:
+            self._sync_source_root(fields)
 
     def keep(self):
         """Deletes all patches that are **not** in this view from the
@@ -335,59 +385,85 @@ class _PatchesView(fov.DatasetView):
         self._patches_dataset.delete()
         _view = self._patches_stage.load_view(self._source_collection)
         self._patches_dataset = _view._patches_dataset
+        self.__label_types.clear()
+        self.__source_label_paths.clear()
 
         super().reload()
 
     def _sync_source_sample(self, sample):
+        self._sync_source_samples([sample])
+
+    def _sync_source_samples(self, samples):
+        if not samples:
+            return
+
+        sample_ids = [sample[self._id_field] for sample in samples]
+
+        labels = {}
         for field in self._label_fields:
-            self._sync_source_sample_field(sample, field)
+            label_type = self._get_patches_label_type(field)
+            is_list_field = issubclass(label_type, fol._HasLabelList)
 
-    def _sync_source_sample_field(self, sample, field):
-        label_type = self._patches_dataset._get_label_field_type(field)
-        is_list_field = issubclass(label_type, fol._HasLabelList)
+            docs = []
+            for sample in samples:
+                doc = sample._doc.field_to_mongo(field)
+                if is_list_field:
+                    doc = doc[label_type._LABEL_LIST_FIELD]
 
-        sample_id = sample[self._id_field]
+                docs.append(doc)
 
-        doc = sample._doc.field_to_mongo(field)
-        if is_list_field:
-            doc = doc[label_type._LABEL_LIST_FIELD]
+            labels[field] = (sample_ids, docs)
 
-        self._source_collection._set_labels(field, [sample_id], [doc])
+        self._set_source_labels(labels)
 
-    def _sync_source_field(self, field, ids=None):
-        if field not in self._label_fields:
-            return
+    def _set_source_labels(self, labels):
+        src_collection = self._source_collection
 
-        _, label_path = self._get_label_field_path(field)
+        # Generated collections may need to sync their own sources, so they
+        # must be updated via `_set_labels()`
+        if src_collection._is_generated:
+            for field, (sample_ids, docs) in labels.items():
+                src_collection._set_labels(field, sample_ids, docs)
 
-        if ids is not None:
-            view = self._patches_dataset.mongo(
-                [{"$match": {"_id": {"$in": ids}}}]
+            return
+
+        # Otherwise write the updates for all fields in a single batch
+        batches = defaultdict(lambda: ([], []))
+        for field, (sample_ids, docs) in labels.items():
+            ops, ids, is_frame_field = src_collection._make_set_labels_ops(
+                field, sample_ids, docs
             )
-        else:
-            view = self._patches_dataset
+            all_ops, all_ids = batches[is_frame_field]
+            all_ops.extend(ops)
+            all_ids.extend(ids)
+
+        for is_frame_field, (ops, ids) in batches.items():
+            if ops:
+                src_collection._dataset._bulk_write(
+                    ops, ids=ids, frames=is_frame_field
+                )
 
-        sample_ids, docs = view.aggregate(
-            [foa.Values(self._id_field), foa.Values(label_path, _raw=True)]
-        )
+    def _sync_source_field(self, field, ids=None):
+        if field not in self._label_fields_set:
+            return
 
-        self._source_collection._set_labels(field, sample_ids, docs)
+        for labels in self._iter_label_docs([field], ids=ids):
+            self._set_source_labels(labels)
 
     def _sync_source_field_schema(self, path):
         root = path.split(".", 1)[0]
-        if root not in self._label_fields:
+        if root not in self._label_fields_set:
             return
 
         field = self.get_field(path)
         if field is None:
             return
 
-        _, label_root = self._get_label_field_path(root)
+        label_root = self._get_patches_label_path(root)
         leaf = path[len(label_root) + 1 :]
 
         dst_dataset = self._source_collection._dataset
-        _, dst_path = dst_dataset._get_label_field_path(root)
-        dst_path += "." + leaf
+        dst_path = self._get_source_label_path(root) + "." + leaf
 
         dst_dataset._merge_sample_field_schema({dst_path: field})
 
@@ -395,40 +471,127 @@ class _PatchesView(fov.DatasetView):
             self._source_collection._sync_source_field_schema(dst_path)
 
     def _sync_source_root(self, fields, update=True, delete=False):
-        for field in fields:
-            self._sync_source_root_field(field, update=update, delete=delete)
-
-    def _sync_source_root_field(self, field, update=True, delete=False):
-        if field not in self._label_fields:
+        fields = [f for f in fields if f in self._label_fields_set]
+        if not fields:
             return
 
-        _, label_id_path = self._get_label_field_path(field, "id")
-        label_path = label_id_path.rsplit(".", 1)[0]
-
         if update:
-            sample_ids, docs = self._patches_dataset.aggregate(
-                [
-                    foa.Values(self._id_field),
-                    foa.Values(label_path, _raw=True),
-                ]
-            )
-
-            self._source_collection._set_labels(field, sample_ids, docs)
+            for labels in self._iter_label_docs(fields):
+                self._set_source_labels(labels)
 
         if delete:
-            all_ids = self._patches_dataset.values(label_id_path, unwind=True)
-            self_ids = self.values(label_id_path, unwind=True)
-            del_ids = set(all_ids) - set(self_ids)
+            # Deletions are issued per field so that each write only touches
+            # the source samples that contain that field's deleted labels
+            for field, (sample_ids, del_ids) in self._get_deleted_label_ids(
+                fields
+            ).items():
+                if del_ids:
+                    self._source_collection._delete_labels(
+                        ids=del_ids, fields=field, sample_ids=sample_ids
+                    )
+
+    def _get_patches_label_type(self, field):
+        # Label types are cached because this is called every time a patch is
+        # saved
+        label_type = self.__label_types.get(field, None)
+        if label_type is None:
+            label_type = self._patches_dataset._get_label_field_type(field)
+            self.__label_types[field] = label_type
+
+        return label_type
+
+    def _get_patches_label_path(self, field, subfield=None):
+        label_type = self._get_patches_label_type(field)
+
+        path = field
+        if issubclass(label_type, fol._HasLabelList):
+            path += "." + label_type._LABEL_LIST_FIELD
+
+        if subfield:
+            path += "." + subfield
+
+        return path
+
+    def _get_source_label_path(self, field):
+        path = self.__source_label_paths.get(field, None)
+        if path is None:
+            _, path = self._source_collection._get_label_field_path(field)
+            self.__source_label_paths[field] = path
+
+        return path
+
+    def _iter_label_docs(self, fields, ids=None):
+        # Extract the source IDs and raw label docs for all fields in a single
+        # pass, and emit them in batches so that they are never all in memory
+        pipeline = []
 
-            if del_ids:
-                self._source_collection._delete_labels(
-                    ids=del_ids, fields=field
-                )
+        if ids is not None:
+            pipeline.append({"$match": {"_id": {"$in": ids}}})
+
+        project = {"_id": False, "sample_id": "$_" + self._id_field}
+        for idx, field in enumerate(fields):
+            project["doc%d" % idx] = "$" + self._get_patches_label_path(field)
+
+        pipeline.append({"$project": project})
+
+        results = self._patches_dataset._aggregate(pipeline=pipeline)
+        batch_size = fou.recommend_batch_size_for_value(
+            ObjectId(), max_size=100000
+        )
+        for batch in fou.iter_batches(results, batch_size):
+            sample_ids = [d["sample_id"] for d in batch]
+
+            labels = {}
+            for idx, field in enumerate(fields):
+                key = "doc%d" % idx
+                labels[field] = (sample_ids, [d.get(key, None) for d in batch])
+
+            yield labels
+
+    def _get_deleted_label_ids(self, fields):
+        # A view without stages contains every patch, so nothing was deleted
+        if not self._stages or not fields:
+            return {f: (set(), []) for f in fields}
+
+        label_id_paths = [
+            self._get_patches_label_path(f, "_id") for f in fields
+        ]
+
+        keep_ids = [
+            set(_ids) for _ids in self.values(label_id_paths, unwind=True)
+        ]
+        sample_ids, *all_label_ids = self._patches_dataset.values(
+            ["_" + self._id_field] + label_id_paths
+        )
+
+        # Record the source samples that contain deleted labels so that the
+        # deletion can be restricted to them
+        results = {}
+        for field, _keep_ids, label_ids in zip(
+            fields, keep_ids, all_label_ids
+        ):
+            label_type = self._get_patches_label_type(field)
+            is_list_field = issubclass(label_type, fol._HasLabelList)
+
+            del_sample_ids = set()
+            del_ids = []
+            for sample_id, _label_ids in zip(sample_ids, label_ids):
+                if not is_list_field:
+                    _label_ids = [_label_ids]
+
+                for _label_id in _label_ids or []:
+                    if _label_id is not None and _label_id not in _keep_ids:
+                        del_ids.append(_label_id)
+                        del_sample_ids.add(sample_id)
+
+            results[field] = (del_sample_ids, del_ids)
+
+        return results
 
     def _sync_source_keep_fields(self):
         src_schema = self.get_field_schema()
 
-        del_fields = set(self._label_fields) - set(src_schema.keys())
+        del_fields = self._label_fields_set.difference(src_schema.keys())
         if del_fields:
             self._source_collection.exclude_fields(del_fields).keep_fields()
 
@@ -473,6 +636,7 @@ class PatchesView(_PatchesView):
         )
 
         self._patches_field = patches_stage.field
+        self.__label_fields = [self._patches_field]
 
     @property
     def _sample_cls(self):
@@ -480,7 +644,7 @@ class PatchesView(_PatchesView):
 
     @property
     def _label_fields(self):
-        return [self._patches_field]
+        return self.__label_fields
 
     @property
     def patches_field(self):
@@ -532,6 +696,7 @@ class EvaluationPatchesView(_PatchesView):
         eval_info = source_collection.get_evaluation_info(eval_key)
         self._gt_field = eval_info.config.gt_field
         self._pred_field = eval_info.config.pred_field
+        self.__label_fields = [self._gt_field, self._pred_field]
 
     @property
     def _sample_cls(self):
@@ -539,7 +704,7 @@ class EvaluationPatchesView(_PatchesView):
 
     @property
     def _label_fields(self):
-        return [self._gt_field, self._pred_field]
+        return self.__label_fields
 
     @property
     def gt_field(self):
@@ -598,7 +763,7 @@ def make_patches_dataset(
 
     fova.validate_collection(sample_collection, media_type=fom.IMAGE)
 
-    if etau.is_str(other_fields):
+    if isinstance(other_fields, str):
         other_fields = [other_fields]
 
     is_frame_patches = sample_collection._is_frames
@@ -606,6 +771,8 @@ def make_patches_dataset(
         sample_collection, field, keep_label_lists
     )
 
+    # Patches have the same IDs as their labels, so the default `_id` index
+    # also serves lookups by label ID
     dataset = fod.Dataset(name=name, _patches=True, _frames=is_frame_patches)
     dataset.media_type = fom.IMAGE
     dataset.add_sample_field("sample_id", fof.ObjectIdField)
@@ -750,7 +917,7 @@ def make_evaluation_patches_dataset(
             "first convert your video dataset to frames via `to_frames()`"
         )
 
-    if etau.is_str(other_fields):
+    if isinstance(other_fields, str):
         other_fields = [other_fields]
 
     _gt_field = sample_collection.get_field(gt_field)
@@ -101,6 +101,7 @@ class FramesView(fov.DatasetView):
         self.__stages = _stages
         self.__media_type = _media_type
         self.__name = _name
+        self.__source_stages = None
 
     def __copy__(self):
         return self.__class__(
@@ -138,11 +139,14 @@ class FramesView(fov.DatasetView):
 
     @property
     def _all_stages(self):
-        return (
-            self._source_collection.view()._all_stages
-            + [self._frames_stage]
-            + self.__stages
-        )
+        # The source stages never change, so they are computed only once
+        if self.__source_stages is None:
+            self.__source_stages = (
+                self._source_collection.view()._all_stages
+                + [self._frames_stage]
+            )
+
+        return self.__source_stages + self.__stages
 
     @property
     def name(self):
@@ -303,8 +307,8 @@ class FramesView(fov.DatasetView):
 
         self._sync_source(fields=[field_name], ids=sample_ids)
 
-    def _delete_labels(self, ids, fields=None):
-        super()._delete_labels(ids, fields=fields)
+    def _delete_labels(self, ids, fields=None, sample_ids=None):
+        super()._delete_labels(ids, fields=fields, sample_ids=sample_ids)
 
         if fields is not None:
             if etau.is_str(fields):
@@ -316,7 +320,15 @@ class FramesView(fov.DatasetView):
         else:
             frame_fields = None
 
-        self._source_collection._delete_labels(ids, fields=frame_fields)
+        if sample_ids is not None:
+            # Convert frame IDs to the IDs of the videos that contain them
+            sample_ids = self._frames_dataset.select(sample_ids).distinct(
+                "_sample_id"
+            )
+
+        self._source_collection._delete_labels(
+            ids, fields=frame_fields, sample_ids=sample_ids
+        )
 
     def _sync_source_sample(self, sample):
         self._sync_source_schema()
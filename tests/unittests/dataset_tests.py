@@ -3793,6 +3793,24 @@ class DatasetDeletionTests(unittest.TestCase):
 
         self.assertEqual(num_labels_after, num_labels - num_ids)
 
+    def test_delete_detections_ids_sample_ids(self):
+        self._setUp_detections()
+
+        sample = self.dataset.first()
+        ids = [
+            sample.ground_truth.detections[0].id,
+            self.dataset.last().ground_truth.detections[-1].id,
+        ]
+
+        num_labels = self.dataset.count("ground_truth.detections")
+
+        # Only labels in the provided samples are deleted
+        self.dataset.delete_labels(ids=ids, sample_ids=[sample.id])
+
+        num_labels_after = self.dataset.count("ground_truth.detections")
+
+        self.assertEqual(num_labels_after, num_labels - 1)
+
     def test_delete_detections_tags(self):
         self._setUp_detections()
 
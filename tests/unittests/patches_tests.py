@@ -9,9 +9,11 @@ from copy import deepcopy
 
 from bson import ObjectId
 import unittest
+from unittest.mock import patch
 
 import fiftyone as fo
 from fiftyone import ViewField as F
+import fiftyone.core.utils as fou
 
 from decorators import drop_datasets
 
@@ -318,6 +320,163 @@ class PatchesTests(unittest.TestCase):
         self.assertTrue(still_view.is_saved)
         self.assertEqual(still_view, view)
 
+    @drop_datasets
+    def test_to_patches_save_context(self):
+        dataset = fo.Dataset()
+
+        sample1 = fo.Sample(
+            filepath="image1.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog"),
+                    fo.Detection(label="rabbit"),
+                ]
+            ),
+        )
+
+        sample2 = fo.Sample(
+            filepath="image2.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog"),
+                ]
+            ),
+        )
+
+        dataset.add_samples([sample1, sample2])
+
+        view = dataset.to_patches("ground_truth")
+
+        with view.save_context(batch_size=10) as context:
+            for sample in view:
+                sample.ground_truth.label = sample.ground_truth.label.upper()
+                context.save(sample)
+
+            self.assertListEqual(
+                dataset.distinct("ground_truth.detections.label"),
+                ["cat", "dog", "rabbit"],
+            )
+
+        self.assertDictEqual(
+            view.count_values("ground_truth.label"),
+            {"CAT": 2, "DOG": 2, "RABBIT": 1},
+        )
+        self.assertDictEqual(
+            dataset.count_values("ground_truth.detections.label"),
+            {"CAT": 2, "DOG": 2, "RABBIT": 1},
+        )
+
+    @drop_datasets
+    def test_to_patches_sync_batches(self):
+        dataset = fo.Dataset()
+
+        sample1 = fo.Sample(
+            filepath="image1.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog"),
+                    fo.Detection(label="rabbit"),
+                ]
+            ),
+        )
+
+        sample2 = fo.Sample(
+            filepath="image2.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog"),
+                ]
+            ),
+        )
+
+        dataset.add_samples([sample1, sample2])
+
+        view = dataset.to_patches("ground_truth").set_field(
+            "ground_truth.label", F("label").upper()
+        )
+
+        # Sync one patch per batch
+        with patch.object(
+            fou, "recommend_batch_size_for_value", return_value=1
+        ):
+            view.save()
+
+        self.assertDictEqual(
+            dataset.count_values("ground_truth.detections.label"),
+            {"CAT": 2, "DOG": 2, "RABBIT": 1},
+        )
+
+    @drop_datasets
+    def test_to_patches_chained_stages(self):
+        dataset = fo.Dataset()
+
+        sample = fo.Sample(
+            filepath="image.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat", tags=["test"]),
+                    fo.Detection(label="dog"),
+                    fo.Detection(label="rabbit", tags=["test"]),
+                ]
+            ),
+        )
+
+        dataset.add_sample(sample)
+
+        patches = dataset.to_patches("ground_truth")
+
+        view = patches.filter_labels("ground_truth", F("label") != "dog")
+        ids = view.values("id")
+
+        self.assertEqual(len(view.limit(5)), 2)
+        self.assertEqual(len(patches.select(ids).limit(1)), 1)
+        self.assertIsNotNone(patches.select(ids).first())
+
+        view.select_labels(tags="test").untag_labels("test")
+
+        self.assertDictEqual(patches.count_label_tags(), {})
+        self.assertDictEqual(dataset.count_label_tags(), {})
+
+    @drop_datasets
+    def test_to_patches_reload(self):
+        dataset = fo.Dataset()
+
+        sample = fo.Sample(
+            filepath="image.png",
+            ground_truth=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog"),
+                ]
+            ),
+        )
+
+        dataset.add_sample(sample)
+
+        view = dataset.to_patches("ground_truth")
+
+        self.assertEqual(view.count(), 2)
+
+        sample.ground_truth.detections[0].label = "rabbit"
+        sample.ground_truth.detections.pop(1)
+        sample.ground_truth.detections.append(fo.Detection(label="squirrel"))
+        sample.save()
+
+        view.reload()
+
+        self.assertEqual(view.count(), 2)
+        self.assertListEqual(
+            sorted(view.values("ground_truth.label")), ["rabbit", "squirrel"]
+        )
+        self.assertSetEqual(
+            set(view.values("ground_truth.id")),
+            set(dataset.values("ground_truth.detections.id", unwind=True)),
+        )
+
     @drop_datasets
     def test_to_evaluation_patches(self):
         dataset = fo.Dataset()